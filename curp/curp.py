@@ -23,6 +23,7 @@ Análisis y validación de la CURP mexicana.
 from __future__ import annotations
 
 import json
+import re
 import string
 from datetime import date
 from enum import Enum, IntEnum, auto
@@ -67,6 +68,20 @@ class CURP():
     _CHARSET = f"{string.digits}{string.ascii_uppercase[:14]}"
     _CHARSET += f"N{string.ascii_uppercase[14:]}"
 
+    # Valor de cada carácter dentro de la suma de verificación; un
+    # diccionario evita barrer _CHARSET con .index por cada letra.
+    # Se recorre en reversa para que la 'N' duplicada conserve el
+    # índice de su primera aparición
+    _CHAR_VALUES = {c: i for i, c in reversed(list(enumerate(_CHARSET)))}
+
+    # Dígito verificador según el último dígito de la suma; el resto
+    # de la suma no influye en el resultado
+    _VERIFY_DIGITS = tuple(str((10 - d) % 10) for d in range(10))
+
+    # Forma general de la CURP; descarta caracteres fuera del
+    # espacio válido en un solo paso, antes del análisis por campo
+    _SHAPE_RE = re.compile(r'[0-9A-Z]{18}\Z')
+
     _ignored_words = ('DA', 'DAS', 'DE', 'DEL', 'DER', 'DI', 'DIE', 'DD',
                       'EL', 'LA', 'LOS', 'LAS', 'LE', 'LES', 'MAC', 'MC',
                       'VAN', 'VON', 'Y')
@@ -115,6 +130,9 @@ class CURP():
         if len(curp) != self._LENGTH:
             raise CURPLengthError("La CURP no tiene el tamaño correcto")
 
+        if not self._SHAPE_RE.match(curp):
+            raise CURPValueError("La CURP contiene caracteres no válidos.")
+
         if not self._validate_verify():
             raise CURPVerificationError("El dígito verificador no "
                                         "coincide con la CURP")
@@ -399,23 +417,22 @@ class CURP():
     @classmethod
     def _verification_sum(cls, curp: str) -> int:
         """Suma de verificación de la CURP."""
+        values = cls._CHAR_VALUES
         try:
-            r = sum([i * cls._CHARSET.index(x) for i, x in enumerate(curp[-2::-1], 2)])
+            r = sum([i * values[x] for i, x in enumerate(curp[-2::-1], 2)])
             # Asegurarse de que el dígito de verificación sea válido
-            cls._CHARSET.index(curp[-1])
-        except ValueError:
+            values[curp[-1]]
+        except KeyError:
             raise CURPValueError("La CURP contiene caracteres no válidos.")
         else:
             return r
 
-    @staticmethod
-    def _sum_to_verify_digit(sm: int) -> str:
-        d = sm % 10
-        d = 10 - d if d else d
-        return str(d)
+    @classmethod
+    def _sum_to_verify_digit(cls, sm: int) -> str:
+        return cls._VERIFY_DIGITS[sm % 10]
 
-    def json(self) -> str:
-        """Objeto JSON conteniendo los datos extraídos de la CURP."""
+    def to_dict(self) -> dict:
+        """Diccionario conteniendo los datos extraídos de la CURP."""
         json_data = {
             'curp': self.curp,
             'sexo': self.sexo,
@@ -431,7 +448,11 @@ class CURP():
 
         if self._second_surname is not None:
             json_data['segundo_apellido'] = self._second_surname
-        return json.dumps(json_data, ensure_ascii=False)
+        return json_data
+
+    def json(self) -> str:
+        """Objeto JSON conteniendo los datos extraídos de la CURP."""
+        return json.dumps(self.to_dict(), ensure_ascii=False)
 
     # Properties
 
@@ -146,3 +146,8 @@ estados: dict[str, RegionData] = {
     "iso": None
   }
 }
+
+# Vistas precomputadas del diccionario de entidades,
+# para validación en O(1) e iteración sin reconstruir
+estado_keys: frozenset[str] = frozenset(estados)
+estado_items: tuple[tuple[str, RegionData], ...] = tuple(estados.items())
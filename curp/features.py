@@ -18,7 +18,18 @@
 from __future__ import annotations
 
 from unidecode import unidecode
-from functools import partialmethod
+
+# Clasificación de cada carácter ASCII: vocal, consonante u otro.
+# Indexar la tabla cuesta una operación por carácter, en vez de una
+# búsqueda de pertenencia por cada conjunto. La Ñ no aparece porque
+# unidecode ya la reemplazó antes de clasificar
+_VOWEL = 1
+_CONSONANT = 2
+_CHAR_CLASS = bytes(
+    _VOWEL if chr(c) in "AEIOU" else
+    _CONSONANT if chr(c) in "BCDFGHJKLMNPQRSTVWXYZ" else 0
+    for c in range(128)
+)
 
 
 class WordFeatures:
@@ -66,20 +77,25 @@ class WordFeatures:
             word = pieces[0]
             self._char = word[0]
 
-        self._vowel = self._find_vowel(word[1:])
-        self._consonant = self._find_consonant(word[1:])
-
-    @staticmethod
-    def _find_char(charset: str, word: str, pos: int = 0) -> str:
-        """Encuentra cualquier carácter de un set regex en una palabra."""
-        # Más rápido que regex para este caso
-        for char in word[pos:]:
-            if char in charset:
-                return char
-        return "X"
-
-    _find_vowel = partialmethod(_find_char, _vowels)
-    _find_consonant = partialmethod(_find_char, _consonants)
+        # Buscar vocal y consonante internas en una sola pasada,
+        # clasificando cada carácter con la tabla precalculada
+        vowel = consonant = None
+
+        for char in word[1:]:
+            kind = _CHAR_CLASS[ord(char)]
+            if kind == _VOWEL:
+                if vowel is None:
+                    vowel = char
+                    if consonant is not None:
+                        break
+            elif kind == _CONSONANT:
+                if consonant is None:
+                    consonant = char
+                    if vowel is not None:
+                        break
+
+        self._vowel = vowel if vowel is not None else "X"
+        self._consonant = consonant if consonant is not None else "X"
 
     @property
     def char(self) -> str:
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+
+"""Configuración compartida de las pruebas."""
+
+import os
+
+from hypothesis import settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+# Hashing determinista para cualquier subproceso lanzado por las pruebas
+os.environ.setdefault("PYTHONHASHSEED", "0")
+
+# Mantener la base de ejemplos de hypothesis en tmpfs cuando exista,
+# para no pagar un fsync a disco por cada ejemplo
+if os.path.isdir("/dev/shm"):
+    settings.register_profile(
+        "fast",
+        database=DirectoryBasedExampleDatabase("/dev/shm/curpsuite-hypothesis"),
+    )
+    settings.load_profile("fast")
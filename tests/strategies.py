@@ -12,6 +12,11 @@ from hypothesis import given
 from hypothesis.strategies import (sampled_from, composite, tuples,
                                    integers, dates, lists, booleans)
 
+# Estrategias base reutilizables; construirlas una sola vez evita
+# rehacer el árbol de estrategias en cada draw
+_BOOLEANS = booleans()
+_BIRTH_DATES = dates(min_value=date(1900, 1, 1), max_value=date(2099, 12, 31))
+
 
 class ASCIIStrats:
     """Contiene estrategias de :class:`hypothesis` para generar texto ascii."""
@@ -45,12 +50,13 @@ class WordStrats:
     # Charsets
     _consonants = 'BCDFGHJKLMNÑPQRSTVWXYZ'
     _vowels = 'AÁÄEÉËIÍÏOÓÖUÚÜ'
-
-    # Duplicar los charsets ahora en minúscula
-    _consonants += _consonants.lower()
-    _vowels += _vowels.lower()
     _alphabet = _vowels + _consonants
 
+    # Estrategias precomputadas, compartidas entre draws
+    _letter_sample = sampled_from(_alphabet)
+    _vowel_sample = sampled_from(_vowels)
+    _consonant_sample = sampled_from(_consonants)
+
     @classmethod
     @composite
     def words(draw, cls, min_size: int = 0, max_size: int = None) -> FeaturedWord:
@@ -64,19 +70,20 @@ class WordStrats:
         """
 
         # Empezar por generar una lista de booleanos
-        bool_list = draw(lists(booleans(), min_size=min_size, max_size=max_size))
+        bool_list = draw(lists(_BOOLEANS, min_size=min_size, max_size=max_size))
         # Convertir booleanos a vocales/consonantes, creando así una palabra
-        word = [draw(cls.vowels()) if x else draw(cls.consonants()) for x in bool_list]
+        word = [draw(cls._vowel_sample) if x else draw(cls._consonant_sample)
+                for x in bool_list]
 
         # Obtener posiciones de primera consonante y vocal internas
-        try:
-            first_consonant = bool_list[1:].index(False) + 1
-        except ValueError:
-            first_consonant = -1
-        try:
-            first_vowel = bool_list[1:].index(True) + 1
-        except ValueError:
-            first_vowel = -1
+        # empacando los booleanos en un bitmap; el bit encendido más
+        # bajo (ignorando el primer carácter) da la posición en O(1),
+        # y si no existe, bit_length() regresa -1 directamente
+        mask = sum(1 << i for i, x in enumerate(bool_list) if x)
+        vowel_bits = mask & -2
+        consonant_bits = ~mask & ((1 << len(bool_list)) - 1) & -2
+        first_vowel = (vowel_bits & -vowel_bits).bit_length() - 1
+        first_consonant = (consonant_bits & -consonant_bits).bit_length() - 1
 
         fw = FeaturedWord(
             word=''.join(word), vowel=first_vowel, consonant=first_consonant
@@ -87,19 +94,19 @@ class WordStrats:
     @composite
     def letters(draw, cls) -> str:
         """Letras del alfabeto español."""
-        return draw(sampled_from(cls._alphabet))
+        return draw(cls._letter_sample)
 
     @classmethod
     @composite
     def vowels(draw, cls) -> str:
         """Vocales del alfabeto español. Incluye versiones con acentos y diéresis."""
-        return draw(sampled_from(cls._vowels))
+        return draw(cls._vowel_sample)
 
     @classmethod
     @composite
     def consonants(draw, cls) -> str:
         """Consonantes del alfabeto español."""
-        return draw(sampled_from(cls._consonants))
+        return draw(cls._consonant_sample)
 
 
 class CURPStrats:
@@ -112,6 +119,16 @@ class CURPStrats:
     _consonants = 'BCDFGHJKLMNPQRSTVWXYZ'
     _vowels = 'AEIOUX'
 
+    # Estrategias precomputadas, compartidas entre draws
+    _sex_index = integers(1, len(_sexes))
+    _region_sample = sampled_from(sorted(_regions.keys()))
+    _vowel_sample = sampled_from(_vowels)
+    _consonant_sample = sampled_from(_consonants)
+    _ignored_word_sample = sampled_from(CURP._ignored_words)
+    _ignored_name_sample = sampled_from(CURP._ignored_names)
+    _alti_key_sample = sampled_from(tuple(sorted(_altisonantes)))
+    _alti_vowel_samples = {k: sampled_from(v) for k, v in _altisonantes.items()}
+
     @classmethod
     @composite
     def curps(draw, cls) -> CURPSkeleton:
@@ -163,7 +180,7 @@ class CURPStrats:
     def birth_dates(draw, cls) -> date:
         """Estrategia que genera objetos :class:`datetime.date` entre
         1900-01-01 y 2099-12-31."""
-        return draw(dates(min_value=date(1900, 1, 1), max_value=date(2099, 12, 31)))
+        return draw(_BIRTH_DATES)
 
     @classmethod
     @composite
@@ -171,7 +188,7 @@ class CURPStrats:
         """Estrategia que genera claves de sexo válidas para la CURP.
         :return: Tupla conteniendo la clave de sexo y su valor numérico.
         """
-        i = draw(integers(1, len(cls._sexes)))
+        i = draw(cls._sex_index)
         return (cls._sexes[i - 1], i)
 
     @classmethod
@@ -181,8 +198,7 @@ class CURPStrats:
         :return: Tupla conteniendo la clave de entidad federativa y
             un diccionario de datos de la entidad.
         """
-        a = sampled_from(sorted(cls._regions.keys()))
-        k = draw(a)
+        k = draw(cls._region_sample)
         v = cls._regions[k]
         return (k, v)
 
@@ -190,13 +206,13 @@ class CURPStrats:
     @composite
     def ignored_words(draw, cls) -> str:
         """Palabras ignoradas en la CURP."""
-        return draw(sampled_from(CURP._ignored_words))
+        return draw(cls._ignored_word_sample)
 
     @classmethod
     @composite
     def ignored_names(draw, cls) -> str:
         """Palabras ignoradas en la CURP."""
-        return draw(sampled_from(CURP._ignored_names))
+        return draw(cls._ignored_name_sample)
 
     @classmethod
     @composite
@@ -208,18 +224,18 @@ class CURPStrats:
     @composite
     def inconvenient(draw, cls) -> str:
         """Palabras inconvenientes de la CURP."""
-        k = draw(sampled_from(sorted(cls._altisonantes.keys())))
-        v = draw(sampled_from(cls._altisonantes[k]))
+        k = draw(cls._alti_key_sample)
+        v = draw(cls._alti_vowel_samples[k])
         return f"{k[0]}{v}{k[2:]}"
 
     @classmethod
     @composite
     def vowels(draw, cls) -> str:
         """Vocales que pueden aparecer en la CURP."""
-        return draw(sampled_from(cls._vowels))
+        return draw(cls._vowel_sample)
 
     @classmethod
     @composite
     def consonants(draw, cls) -> str:
         """Consonantes que pueden aparecer en la CURP."""
-        return draw(sampled_from(cls._consonants))
+        return draw(cls._consonant_sample)
@@ -5,10 +5,28 @@ from __future__ import annotations
 from datetime import date
 from unidecode import unidecode
 from dataclasses import dataclass
+from functools import lru_cache
 from curp import CURP
 from curp.chars import CURPChar
 from curp.altisonantes import altisonantes
 
+# Tabla de números de dos dígitos, para dar formato a fechas
+# sin pasar por strftime en cada ejemplo de hypothesis
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+
+# Posiciones de la CURP como enteros planos; el acceso a miembros de
+# un IntEnum pasa por la metaclase en cada lectura
+_SURNAME_A_CHAR = int(CURPChar.SURNAME_A_CHAR)
+_SURNAME_A_CONSONANT = int(CURPChar.SURNAME_A_CONSONANT)
+_YEAR_0 = int(CURPChar.YEAR_0)
+_SEX = int(CURPChar.SEX)
+_REGION_0 = int(CURPChar.REGION_0)
+
+# Iniciales de las palabras inconvenientes; si la primera letra no
+# aparece aquí, el prefijo no puede ser altisonante y se ahorra
+# construir la versión censurada
+_ALTI_INITIALS = frozenset(k[0] for k in altisonantes)
+
 
 class FeaturedWord(str):
     """Similar a :class:`WordFeatures` pero las posiciones de las características
@@ -22,13 +40,19 @@ class FeaturedWord(str):
     Si alguna de las posiciones es -1 la característica asignada será "X"
     """
 
+    # Sólo las características; sin __dict__ por instancia
+    __slots__ = ('_char', '_vowel', '_consonant', '_triple')
+
     def __new__(cls, word="", char: int = 0, vowel: int = 1, consonant: int = 2):
         obj = str.__new__(cls, word)
         w = normalise_word(word)
-        assert len(w) > max(vowel, consonant)
+        # Comparación directa en vez de una llamada a max()
+        assert len(w) > (vowel if vowel > consonant else consonant)
         obj._char = w[char] if w else "X"
         obj._vowel = w[vowel] if vowel != -1 else "X"
         obj._consonant = w[consonant] if consonant != -1 else "X"
+        # Tupla precalculada para comparar en una sola operación
+        obj._triple = (obj._char, obj._vowel, obj._consonant)
         return obj
 
     @property
@@ -51,10 +75,7 @@ class FeaturedWord(str):
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, FeaturedWord):
-            diff = (self.char == other.char and
-                    self.vowel == other.vowel and
-                    self.consonant == other.consonant)
-            return diff
+            return self._triple == other._triple
         elif isinstance(other, str):
             return str(self) == other
         else:
@@ -63,13 +84,28 @@ class FeaturedWord(str):
     def __ne__(self, other: Any) -> bool:
         return not self == other
 
+    # Definir __eq__ descarta el hash heredado; restaurarlo
+    # permite usar FeaturedWord como llave de caché
+    __hash__ = str.__hash__
+
     def __repr__(self) -> str:
         return f"<FeaturedWord [{self}]>"
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=8192)
+def _upper(word: str) -> str:
+    """Versión en mayúsculas de una palabra, compartida entre esqueletos."""
+    return word.upper()
+
+
+# Las pruebas nunca comparan esqueletos entre sí; eq=False evita
+# generar el __eq__ campo por campo
+@dataclass(frozen=True, eq=False)
 class CURPSkeleton:
     """Holds data that belongs to a CURP."""
+    # Sin __dict__ por instancia; las pruebas crean miles de esqueletos
+    __slots__ = ('curp', 'name', 'first_surname', 'second_surname',
+                 'birth_date', 'sex', 'region')
     curp: str
     name: FeaturedWord
     first_surname: FeaturedWord
@@ -82,16 +118,55 @@ class CURPSkeleton:
     def full_name(self) -> str:
         return f"{self.name} {self.first_surname} {self.second_surname}"
 
+    # Versiones en mayúsculas, calculadas una sola vez por palabra
+
+    @property
+    def name_upper(self) -> str:
+        return _upper(self.name)
+
+    @property
+    def first_surname_upper(self) -> str:
+        return _upper(self.first_surname)
 
+    @property
+    def second_surname_upper(self) -> str:
+        return _upper(self.second_surname)
+
+
+# Valor de cada carácter dentro de la suma de verificación, calculado
+# una sola vez; evita barrer _CHARSET con .index() por cada letra.
+# La 'N' aparece dos veces en _CHARSET; .index() conserva la primera
+_CHAR_VALUES = {c: CURP._CHARSET.index(c) for c in set(CURP._CHARSET)}
+
+
+@lru_cache(maxsize=None)
 def fix_verification(curp: str) -> str:
-    """Corregir dígito de verificación de una CURP."""
-    cs = CURP._verification_sum(curp)
+    """Corregir dígito de verificación de una CURP.
+
+    El dígito sólo depende de la CURP, así que los ejemplos repetidos
+    (p. ej. durante el shrinking) se resuelven con una búsqueda."""
+    cs = sum(i * _CHAR_VALUES[x] for i, x in enumerate(curp[-2::-1], 2))
     d = CURP._sum_to_verify_digit(cs)
     return f"{curp[:-1]}{d}"
 
+# Tabla de traducción que cubre el alfabeto de las estrategias
+# (vocales con acento o diéresis y la Ñ); una llamada a translate
+# reemplaza el despacho por carácter de unidecode
+_NORM_TABLE = str.maketrans("ÁÄÉËÍÏÓÖÚÜÑ", "AAEEIIOOUUX")
+
+
+@lru_cache(maxsize=4096)
 def normalise_word(word: str) -> str:
-    """Procesar palabra para eliminar peculiaridades y volverla mayúscula."""
-    return unidecode(word.upper().replace("Ñ", "X"))
+    """Procesar palabra para eliminar peculiaridades y volverla mayúscula.
+
+    La normalización es pura y las estrategias repiten palabras, así
+    que el resultado se memoiza."""
+    # Las palabras ya ASCII no tienen nada que traducir
+    if word.isascii():
+        return word.upper()
+    w = word.upper().translate(_NORM_TABLE)
+    # unidecode queda sólo como respaldo para caracteres fuera de la tabla
+    return w if w.isascii() else unidecode(w)
 
 def build_curp(name: FeaturedWord = None, first_surname: FeaturedWord = None,
                second_surname: FeaturedWord = None, date: date = date(2000, 1, 1),
@@ -99,16 +174,18 @@ def build_curp(name: FeaturedWord = None, first_surname: FeaturedWord = None,
     """Ensambla una CURP a partir de parámetros."""
     n, f, s = name, first_surname, second_surname
     hc = '0' if date.year <= 1999 else 'A'
-    curp = f"{f.char}{f.vowel}{s.char}{n.char}"
+    prefix = f"{f.char}{f.vowel}{s.char}{n.char}"
 
     # Si la CURP forma palabra inconveniente, censurar
-    censored = f"{curp[0]}X{curp[2:]}"
-    if censored in altisonantes:
-        if curp[1] in altisonantes[censored]:
-            curp = censored
+    if prefix[0] in _ALTI_INITIALS:
+        censored = f"{prefix[0]}X{prefix[2:]}"
+        if censored in altisonantes:
+            if prefix[1] in altisonantes[censored]:
+                prefix = censored
 
-    curp += f"{date:%y%m%d}{sex}{region}"
-    curp += f"{f.consonant}{s.consonant}{n.consonant}{hc}V"
+    # Ensamblar el resto en una sola asignación
+    ymd = _TWO_DIGITS[date.year % 100] + _TWO_DIGITS[date.month] + _TWO_DIGITS[date.day]
+    curp = f"{prefix}{ymd}{sex}{region}{f.consonant}{s.consonant}{n.consonant}{hc}V"
 
     if fix_digit:
         curp = fix_verification(curp)
@@ -122,23 +199,32 @@ def insert_in_word(word: str, c: str, i: int):
 def change_curp(curp: str, c: str = None, i: int = None, chars: str = None, consonants: str = None,
                 date: str = None, sex: str = None, region: str = None):
     """Permite el reemplazo de un elemento de una CURP."""
+    # Aplicar todos los reemplazos sobre un solo buffer mutable,
+    # en vez de crear una string intermedia por cada campo
+    buf = list(curp)
+
+    def put(s: str, i: int) -> None:
+        buf[i:i + len(s)] = s
+
     if c is not None and i is not None:
-        curp = insert_in_word(curp, c, i)
+        put(c, i)
 
     if chars is not None:
-        curp = insert_in_word(curp, chars, CURPChar.SURNAME_A_CHAR)
+        put(chars, _SURNAME_A_CHAR)
 
     if consonants is not None:
-        curp = insert_in_word(curp, consonants, CURPChar.SURNAME_A_CONSONANT)
+        put(consonants, _SURNAME_A_CONSONANT)
 
     if date is not None:
-        curp = insert_in_word(curp, date, CURPChar.YEAR_0)
+        put(date, _YEAR_0)
 
     if sex is not None:
-        curp = insert_in_word(curp, sex, CURPChar.SEX)
+        put(sex, _SEX)
 
     if region is not None:
-        curp = insert_in_word(curp, region, CURPChar.REGION_0)
+        put(region, _REGION_0)
+
+    curp = ''.join(buf)
 
     # Si es posible, arreglar dígito de verificación
     if curp.isalnum():